@@ -2,17 +2,50 @@
 
 import configparser
 import logging
+from functools import cache
 from importlib.resources import files
 from pathlib import Path
 
 from .custom_types import ConfigValues
 
-# Hardcoded path to the configuration file
-CONFIG_PATH = files("archsnap").joinpath(".config/config.ini")
+
+@cache
+def _config_path() -> Path:
+    """Resolve the hardcoded path to the configuration file.
+
+    Resolving a package resource walks the package finder, so the result is
+    cached and the resolution is deferred to the first call instead of being
+    paid at module import (e.g. in subprocess workers).
+    """
+    return Path(str(files("archsnap").joinpath(".config/config.ini")))
+
+
+# Cache of the parsed configuration, keyed on the config file's modification
+# time, so repeated calls (e.g. on module re-entry in subprocess workers)
+# return the already-parsed values instead of re-reading the file
+_CONFIG_CACHE: tuple[int, ConfigValues, ConfigValues] | None = None
 
 
 def parse_config_file() -> tuple[ConfigValues, ConfigValues]:
     """Parse the configuration file."""
+    # Declare the cache as a global variable so we can write to it
+    global _CONFIG_CACHE  # noqa: PLW0603
+
+    # Get the cached, resolved path to the configuration file
+    config_path = _config_path()
+
+    # Get the modification time of the config file to use as the cache key,
+    # falling back to -1 if the file does not exist or cannot be stat-ed
+    try:
+        config_mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        config_mtime_ns = -1
+
+    # If the config file has not changed since the last parse,
+    # return copies of the cached values without touching the disk
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == config_mtime_ns:
+        return _CONFIG_CACHE[1].copy(), _CONFIG_CACHE[2].copy()
+
     # Default values
     #
     # Default output path for the renders should be in the 'output' directory
@@ -47,12 +80,14 @@ def parse_config_file() -> tuple[ConfigValues, ConfigValues]:
     config_values: ConfigValues = default_values.copy()
 
     # Check if the configuration file exists
-    if CONFIG_PATH.is_file():
+    if config_path.is_file():
         # If it exists, try to read its values
         try:
-            # Read the configuration file contents
+            # Read the configuration file contents in a single read
+            # (ConfigParser.read would tokenize the file incrementally
+            # through a buffered file object)
             config = configparser.ConfigParser()
-            config.read(str(CONFIG_PATH))
+            config.read_string(config_path.read_text(encoding="utf-8"))
 
             # Get the output path as an absolute Path object
             render_output_path = Path(
@@ -88,12 +123,16 @@ def parse_config_file() -> tuple[ConfigValues, ConfigValues]:
                 fallback=default_object_colour,
             )
 
-        # Except any errors when reading the file
-        except configparser.Error as e:
+        # Except any errors when reading the file (OSError included, since
+        # unlike ConfigParser.read, the explicit read_text does not swallow
+        # an unreadable or vanished file itself)
+        except (OSError, configparser.Error):
             logger = logging.getLogger(__name__)
+            # logger.exception appends the traceback (and so the error
+            # itself) to the logged message
             logger.exception(
-                "Error reading config file.",
-                extra=f"{e}\nContinuing with default configuration.",
+                "Error reading config file. "
+                "Continuing with default configuration.",
             )
             return default_values, default_values
 
@@ -106,5 +145,9 @@ def parse_config_file() -> tuple[ConfigValues, ConfigValues]:
             "default_object_colour": default_object_colour,
         }
 
+    # Store copies of the parsed values in the cache alongside the
+    # modification time they were parsed at
+    _CONFIG_CACHE = (config_mtime_ns, config_values.copy(), default_values.copy())
+
     # Return the saved and default configuration values
     return config_values, default_values
@@ -1,8 +1,12 @@
 """Custom types for type-hinting."""
 
-from pathlib import PurePath
-from tkinter import BooleanVar, IntVar, StringVar
-from typing import TypedDict
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypedDict
+
+if TYPE_CHECKING:
+    from pathlib import Path, PurePath
+    from tkinter import BooleanVar, IntVar, StringVar
 
 
 class ConfigValues(TypedDict):
@@ -18,13 +22,13 @@ class ConfigValues(TypedDict):
 class MeshQueueItem(TypedDict):
     """Class for an individual multiprocessing queue dictionary."""
 
-    mesh_path: str
-    output_path: str
+    mesh_path: Path
+    output_path: Path
     separate_output_directories: bool
     use_eevee: bool
     render_resolution: int
     object_scale_factor: float
-    scalebar_tick_size: str
+    scalebar_tick_size: float
     object_colour: str
     index: int
 
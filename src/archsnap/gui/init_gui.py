@@ -1,11 +1,12 @@
 """Entry point of the application GUI."""
 
 import colorsys
+import os
 import tkinter as tk
 import webbrowser
 from functools import partial
 from importlib.resources import files
-from multiprocessing import Pool
+from multiprocessing import Process, Queue
 from pathlib import Path
 from tkinter import colorchooser, messagebox, ttk
 from tkinter.filedialog import askdirectory, askopenfilename
@@ -20,7 +21,7 @@ from archsnap.custom_types import (
     SizeVar,
     SizeVarsDict,
 )
-from archsnap.mesh import get_mesh_args, render_mesh
+from archsnap.mesh import get_mesh_args, render_worker
 
 if TYPE_CHECKING:
     from collections.abc import ItemsView
@@ -61,15 +62,15 @@ def _handle_render() -> None:
     # calculated mesh scale factor, current scalebar tick size, mesh colour and index
     mesh_queue: list[MeshQueueItem] = [
         {
-            "mesh_path": x.entry_text.get(),
-            "output_path": output_frame.output_path.get(),
+            "mesh_path": Path(x.entry_text.get()),
+            "output_path": Path(output_frame.output_path.get()),
             "separate_output_directories": output_frame.separate_output_directories_vars[  # noqa: E501
                 "current"
             ].get(),
             "use_eevee": output_frame.use_eevee_vars["current"].get(),
             "render_resolution": output_frame.render_resolution_vars["current"].get(),
             "object_scale_factor": x.mesh_scale_factor.get(),
-            "scalebar_tick_size": x.current_sizes["scalebar_tick"].get(),
+            "scalebar_tick_size": float(x.current_sizes["scalebar_tick"].get()),
             "object_colour": x.mesh_colour_vars["current"].get(),
             "index": idx,
         }
@@ -78,25 +79,55 @@ def _handle_render() -> None:
         )
     ]
 
-    # Create a pool of len(mesh_queue) processes to run blender instances for each mesh
-    with Pool(len(mesh_queue)) as pool:
-        # Map each item in the list to its own instance of the render_mesh function
-        pool.map(render_mesh, mesh_queue)
-        # Close the queue, letting the worker processes to complete their tasks,
-        # required to call join()
-        pool.close()
-        # Wait until all workers have completed their tasks
-        pool.join()
-        # When the workers completed their tasks, show the user a messagebox
-        # to ask if they want to open the output directory or not
-        open_output = messagebox.askyesno(
-            "Image generation complete",
-            """Image generation was successfully completed!
-            \n\nOpen the output directory?""",
+    # Cap the number of worker processes at the CPU count, so each warm
+    # blender instance is reused across meshes instead of paying the full
+    # blender startup cost once per mesh
+    worker_count = min(len(mesh_queue), os.cpu_count() or 1)
+
+    # Create the multiprocessing work queue and fill it with the mesh queue
+    # items, followed by one sentinel per worker so they know when to exit
+    work_queue: Queue[MeshQueueItem | None] = Queue()
+    for item in mesh_queue:
+        work_queue.put(item)
+    for _ in range(worker_count):
+        work_queue.put(None)
+
+    # Create the resident worker processes that run blender instances and
+    # consume the queue until they receive a sentinel
+    workers = [
+        Process(target=render_worker, args=(work_queue,))
+        for _ in range(worker_count)
+    ]
+    # Start the workers
+    for worker in workers:
+        worker.start()
+    # Wait until all workers have completed their tasks
+    for worker in workers:
+        worker.join()
+
+    # Count the workers that died on an exception instead of exiting cleanly
+    # (a dead worker also drops the queue items it would have consumed)
+    failed_workers = sum(1 for worker in workers if worker.exitcode != 0)
+    # If any worker failed, show the user an error messagebox instead of
+    # the success dialog
+    if failed_workers > 0:
+        messagebox.showerror(
+            "Image generation failed",
+            f"{failed_workers} of {worker_count} render worker processes "
+            "exited with an error, so some renders may be missing.",
         )
-        # If they said yes to opening the output directory, do so
-        if open_output:
-            webbrowser.open(str(Path(output_frame.output_path.get()).absolute()))
+        return
+
+    # When the workers completed their tasks, show the user a messagebox
+    # to ask if they want to open the output directory or not
+    open_output = messagebox.askyesno(
+        "Image generation complete",
+        """Image generation was successfully completed!
+        \n\nOpen the output directory?""",
+    )
+    # If they said yes to opening the output directory, do so
+    if open_output:
+        webbrowser.open(str(Path(output_frame.output_path.get()).absolute()))
 
 
 class _ConfigMeshModal(tk.Toplevel):
@@ -1,5 +1,5 @@
 """Initialiser of the mesh module."""
 
-from .mesh import get_mesh_args, render_mesh
+from .mesh import get_mesh_args, render_mesh, render_worker
 
-__all__ = ["get_mesh_args", "render_mesh"]
+__all__ = ["get_mesh_args", "render_mesh", "render_worker"]
@@ -1,49 +1,200 @@
 """Module for the mesh handling methods."""
 
+import atexit
 import math
+import os
 import sys
+import tempfile
+from bisect import bisect_right
+from functools import cache
 from importlib.resources import files
+from multiprocessing import get_start_method
 from pathlib import Path
-from typing import Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from archsnap.custom_types import MeshQueueItem
 
-# Avoiding the issue of importing bpy while multiprocessing
-# as mentioned in https://github.com/TylerGubala/blenderpy/issues/23#issuecomment-514826760
-ORIG_SYS_PATH = list(sys.path)
-import bpy  # noqa: E402
-
-sys.path = ORIG_SYS_PATH
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from types import ModuleType
 
 # TODO: For performance, change the bpy.ops to matrix transformations where applicable  # noqa: E501, FIX002, TD002, TD003
 
+# Reciprocal of 255 for scaling colour bytes to the decimal (0 to 1) range
+_INV255 = 1.0 / 255.0
+
+# Precomputed powers of ten (1e-9 to 1e9) for the decimal-magnitude lookup
+_POW10 = [10.0**exponent for exponent in range(-9, 10)]
+
+
+def _magnitude(value: float) -> int:
+    """Return floor(log10(value)) for a positive value.
+
+    Looks the magnitude up in a precomputed power-of-ten table, replacing the
+    libm transcendental call for the common range of scalebar tick sizes, and
+    falls back to math.log10 outside it.
+    """
+    # If the value lies outside the table's range, fall back to log10
+    if not _POW10[0] <= value < _POW10[-1]:
+        return math.floor(math.log10(value))
+    # Find the insertion point after the largest power of ten not greater
+    # than the value; since the table starts at 1e-9, subtracting the index
+    # of 1e0 plus one recovers the exponent
+    return bisect_right(_POW10, value) - 10
+
+
+# The lazily imported bpy module, loaded on first use
+_bpy_mod: "ModuleType | None" = None
+
+# Process-level cache of already-prepared meshes, mapping the absolutized
+# mesh file path to an intermediate .blend file (with origin and transforms
+# already applied) and the name of the prepared object inside it, so
+# render_mesh can append the prepared object instead of re-importing and
+# re-preparing from scratch
+_PREPARED_CACHE: dict[str, tuple[str, str]] = {}
+
+
+def _cleanup_prepared_cache() -> None:
+    """Delete the intermediate .blend files written by get_mesh_args."""
+    for cache_blend_path, _ in _PREPARED_CACHE.values():
+        Path(cache_blend_path).unlink(missing_ok=True)
+
+
+# Remove the intermediate files when the interpreter exits; forked render
+# workers exit through os._exit and so never delete files the parent and
+# the other workers still need
+atexit.register(_cleanup_prepared_cache)
+
+# Process-level cache of output directories already confirmed to exist,
+# so repeated renders into the same directory skip the mkdir syscalls
+_ENSURED_DIRS: set[str] = set()
+
+
+@cache
+def _scene_path() -> str:
+    """Resolve the path to the template Blender scene file.
+
+    Resolving a package resource walks the package finder, so the result is
+    cached and only computed on the first render instead of once per call.
+    """
+    return str(files("archsnap").joinpath("data/artefact_scene.blend"))
+
+
+def _bpy() -> "ModuleType":
+    """Import bpy on first use and return the cached module afterwards.
+
+    Importing bpy loads a very large native extension, so deferring it means
+    code paths that never touch Blender (e.g. the configuration screen)
+    do not pay its import cost.
+    """
+    # Declare the cached module as a global variable so we can write to it
+    global _bpy_mod  # noqa: PLW0603
+
+    # If bpy has not been imported yet
+    if _bpy_mod is None:
+        # Avoiding the issue of importing bpy while multiprocessing
+        # as mentioned in https://github.com/TylerGubala/blenderpy/issues/23#issuecomment-514826760
+        orig_sys_path = list(sys.path)
+        import bpy  # noqa: PLC0415
+
+        sys.path = orig_sys_path
+        # Cache the imported module
+        _bpy_mod = bpy
+
+    return _bpy_mod
+
+
+@cache
+def _importers() -> dict[str, Any]:
+    """Return the dispatch table of file extensions to bpy import operators.
+
+    Binding the operators once turns the per-import extension dispatch into
+    a single dict lookup instead of a chain of string compares and bpy
+    attribute walks. Built lazily since bpy itself is lazily imported.
+    """
+    # Lazily import bpy on first use
+    bpy = _bpy()
+
+    return {
+        ".ply": bpy.ops.wm.ply_import,
+        ".obj": bpy.ops.wm.obj_import,
+        ".stl": bpy.ops.wm.stl_import,
+        ".dae": bpy.ops.wm.dae_import,
+    }
+
 
 def import_mesh(mesh_path: Path) -> {str} | Literal[406]:
     """Safely import a compatibe mesh into blender.
 
     Returns either the imported mesh object or a 406.
     """
-    # From the mesh_path Path object, get the suffix
-    extension = mesh_path.suffix
-    # Based on the file extension, run the relevant bpy import function or quit
-    # if invalid
-    match extension:
-        case ".ply":
-            return bpy.ops.wm.ply_import(filepath=str(mesh_path))
-        case ".obj":
-            return bpy.ops.wm.obj_import(filepath=str(mesh_path))
-        case ".stl":
-            return bpy.ops.wm.stl_import(filepath=str(mesh_path))
-        case ".dae":
-            return bpy.ops.wm.dae_import(filepath=str(mesh_path))
-        case _:
-            return 406
+    # From the mesh_path Path object's suffix, look up the pre-bound
+    # bpy import operator for the file extension
+    importer = _importers().get(mesh_path.suffix)
+    # If the file extension is invalid, quit
+    if importer is None:
+        return 406
+    # Run the relevant bpy import function
+    return importer(filepath=str(mesh_path))
+
+
+@cache
+def _probe_cycles_devices() -> str:
+    """Probe the Cycles compute device types and return the winning one.
+
+    Probing initialises the CUDA/OPTIX/HIP/ONEAPI driver stacks, which takes
+    hundreds of ms each and cannot change between renders in one process,
+    so the result is memoized and the probe only runs once per process.
+    """
+    # Lazily import bpy on first use
+    bpy = _bpy()
+
+    # Loop through the available compute types
+    for compute_type in ["CUDA", "OPTIX", "HIP", "ONEAPI"]:
+        # Set the preferences to the current compute type
+        bpy.context.preferences.addons[
+            "cycles"
+        ].preferences.compute_device_type = compute_type
+        # Get the available devices
+        devices = bpy.context.preferences.addons["cycles"].preferences.devices
+        # Loop through them
+        for device in devices:
+            # Set them to be used for rendering
+            device["use"] = True
+        # If the currently set compute type has an active device, it wins
+        if bpy.context.preferences.addons["cycles"].preferences.has_active_device():
+            return compute_type
+
+    # If no compute type has a compatible device, report none
+    # (so rendering falls back to CPU only)
+    return "NONE"
+
+
+def _prepare_object(obj: Any) -> None:  # noqa: ANN401
+    """Set a freshly imported object's origin and apply its location.
+
+    Sets the origin to the centre of volume of the object, moves it to the
+    cartesian centre, and applies the location transform.
+    """
+    # Lazily import bpy on first use
+    bpy = _bpy()
+
+    # Set the origin of the object to the centre of volume of the object
+    # based on its bounding box
+    bpy.ops.object.origin_set(type="ORIGIN_CENTER_OF_VOLUME", center="BOUNDS")
+    # Then move the object's origin to the cartesian centre
+    obj.location = (0, 0, 0)
+    # Apply that location to the object
+    bpy.ops.object.transform_apply(location=True, scale=False, rotation=False)
 
 
 def get_mesh_args(
     mesh_path: Path,
 ) -> tuple[tuple[float, float, float], float] | tuple[None, None]:
     """Get the initial size of a mesh from a pathlib Path object."""
+    # Lazily import bpy on first use
+    bpy = _bpy()
+
     # Set the cursor to the cartesian centre
     bpy.context.scene.cursor.location = (0, 0, 0)
 
@@ -63,22 +214,42 @@ def get_mesh_args(
         # Set it as the active object in the view layer
         bpy.context.view_layer.objects.active = obj
 
-        # Set the origin of the object to the centre of volume of the object
-        # based on its bounding box
-        bpy.ops.object.origin_set(type="ORIGIN_CENTER_OF_VOLUME", center="BOUNDS")
-        # Then move the object's origin to the cartesian centre
-        obj.location = (0, 0, 0)
-        # Apply that location to the object
-        bpy.ops.object.transform_apply(location=True, scale=False, rotation=False)
+        # Set the object's origin and apply its location
+        _prepare_object(obj)
+
+        # Save the prepared object to an intermediate .blend file and record
+        # it in the cache, so render_mesh can append the prepared object
+        # instead of re-importing the mesh from disk and redoing the
+        # preparation. Only the object itself is written (the scene keeps
+        # accumulating the meshes of earlier calls). The cache is only
+        # reachable by workers forked from this process, so skip the write
+        # entirely when worker processes are spawned fresh instead
+        if get_start_method() == "fork":
+            cache_key = str(mesh_path.absolute())
+            # If this mesh was already prepared (e.g. the user re-selected or
+            # re-typed the same file path), delete the superseded intermediate
+            # file before replacing its cache entry, or it would leak into the
+            # temp directory. This is safe because rendering blocks the GUI
+            # until the workers have joined, so no worker can be reading it
+            stale_entry = _PREPARED_CACHE.get(cache_key)
+            if stale_entry is not None:
+                Path(stale_entry[0]).unlink(missing_ok=True)
+            cache_fd, cache_blend_path = tempfile.mkstemp(
+                prefix="archsnap_prepared_",
+                suffix=".blend",
+            )
+            os.close(cache_fd)
+            bpy.data.libraries.write(cache_blend_path, {obj})
+            _PREPARED_CACHE[cache_key] = (cache_blend_path, obj.name)
 
         # Get the initial scalebar tick size by getting the largest object dimension
         # and dividing by the 10 ticks in the scalebar
-        initial_scalebar_tick_size = (
-            max([cast("float", x) for x in obj.dimensions[0:3]]) / 10
-        )
+        # (max over the bpy vector directly, without an intermediate list)
+        initial_scalebar_tick_size = max(obj.dimensions) / 10
 
         # Round the scalebar tick size to the nearest round number (375>400, 325>300)
-        # calculated through -floor(log10(initial_tick_size)).
+        # calculated through -_magnitude(initial_tick_size), i.e.
+        # -floor(log10(initial_tick_size)).
         # The log10(initial_tick_size) caculates the significant digits
         # (log10(0.01)=-2, log10(100)=2), while the floor function makes sure that the
         # right number of significant digits (log10(50)=1.70 > floor(1.70)=1).
@@ -87,7 +258,7 @@ def get_mesh_args(
         # significant digit (round(215,-2)=200)
         scalebar_tick_size = round(
             initial_scalebar_tick_size,
-            -math.floor(math.log10(initial_scalebar_tick_size)),
+            -_magnitude(initial_scalebar_tick_size),
         )
 
         # We return the object dimensions as a single object and then also the
@@ -97,37 +268,51 @@ def get_mesh_args(
             scalebar_tick_size,
         )
 
-    # Close this blender instance
-    bpy.ops.wm.quit_blender()
-
     return None, None
 
 
 def render_mesh(mesh_queue: MeshQueueItem) -> None:  # noqa: C901, PLR0912, PLR0915
     """Render the mesh from a multiprocessing mesh queue object."""
-    # Get the variables from the mesh queue
-    mesh_path = Path(mesh_queue["mesh_path"])
-    output_path = Path(mesh_queue["output_path"])
+    # Lazily import bpy on first use
+    bpy = _bpy()
+
+    # Get the variables from the mesh queue (the queue producer already
+    # converted them to their final types, so no per-mesh conversion is
+    # needed here)
+    mesh_path = mesh_queue["mesh_path"]
+    output_path = mesh_queue["output_path"]
     separate_output_directories = mesh_queue["separate_output_directories"]
     use_eevee = mesh_queue["use_eevee"]
     render_resolution = mesh_queue["render_resolution"]
     object_scale_factor = mesh_queue["object_scale_factor"]
-    scalebar_tick_size = float(mesh_queue["scalebar_tick_size"])
+    scalebar_tick_size = mesh_queue["scalebar_tick_size"]
     object_colour = mesh_queue["object_colour"]
     index = mesh_queue["index"]
 
+    # The mesh file name with the dots replaced, reused for the output
+    # directory name and the render file names
+    mesh_name = mesh_path.name.replace(".", "_")
+
     # If the user chose to save the renders in separate output directories
     if separate_output_directories:
         # Set the correct output path for this mesh
-        output_path = Path(output_path / f"{index}_{mesh_path.name.replace('.', '_')}")
-    # Recursively create all the necessary directories to the output directory
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    # Get the template Blender scene file path
-    scene_path = files("archsnap").joinpath("data/artefact_scene.blend")
+        output_path = Path(output_path / f"{index}_{mesh_name}")
+    # Recursively create all the necessary directories to the output
+    # directory, unless this worker already confirmed they exist
+    output_path_key = os.fspath(output_path)
+    if output_path_key not in _ENSURED_DIRS:
+        output_path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(output_path_key)
 
     # Open the template Blender scene file in our Blender instance
-    bpy.ops.wm.open_mainfile(filepath=str(scene_path))
+    # (the resolved scene file path is cached across calls)
+    bpy.ops.wm.open_mainfile(filepath=_scene_path())
+    # Keep the evaluated scene data resident across the six frames of the
+    # animation render, since only the camera changes between frames
+    bpy.context.scene.render.use_persistent_data = True
+    # The views are static, so skip the motion blur subframe work
+    # (the setting is shared by EEVEE and Cycles in current Blender)
+    bpy.context.scene.render.use_motion_blur = False
     # Setup the render resolution settings
     bpy.context.scene.render.resolution_x = render_resolution
     bpy.context.scene.render.resolution_y = render_resolution
@@ -142,39 +327,56 @@ def render_mesh(mesh_queue: MeshQueueItem) -> None:  # noqa: C901, PLR0912, PLR0
     else:
         # Else set Cycles as the render engine
         bpy.context.scene.render.engine = "CYCLES"
-        # Loop through the available compute types
-        for compute_type in ["CUDA", "OPTIX", "HIP", "ONEAPI"]:
-            # Set the preferences to the current compute type
-            bpy.context.preferences.addons[
-                "cycles"
-            ].preferences.compute_device_type = compute_type
-            # Get the available devices
-            devices = bpy.context.preferences.addons["cycles"].preferences.devices
-            # Loop through them
-            for device in devices:
-                # Set them to be used for rendering
-                device["use"] = True
-            # If the currently set compute type has an active device
-            if bpy.context.preferences.addons["cycles"].preferences.has_active_device():
-                # Set the Cycles engine device to GPU Compute and quit the loop
-                bpy.context.scene.cycles.device = "GPU"
-                break
-            # If it does not have an active device and we already arrived at the last
-            # compute type
-            if compute_type == "ONEAPI":
-                # Set the compute type to none
-                # (since we did not find a compatible device)
-                bpy.context.preferences.addons[
-                    "cycles"
-                ].preferences.compute_device_type = "NONE"
-                # And set the rendering device to CPU only
-                bpy.context.scene.cycles.device = "CPU"
-            # If we are not yet at the last compute type, we can continue looping
-            else:
-                continue
-
-    # Import the mesh to render and grab the result of the importing
-    import_result = import_mesh(mesh_path)
+        # Get the memoized winning compute type (the driver probe only runs
+        # on the first render in this process) and re-apply it
+        compute_type = _probe_cycles_devices()
+        bpy.context.preferences.addons[
+            "cycles"
+        ].preferences.compute_device_type = compute_type
+        # Re-enable the devices of the chosen compute type on every render:
+        # only the probe is expensive, and the use flags live in the
+        # preferences, which may have been reset since the probe ran
+        for device in bpy.context.preferences.addons["cycles"].preferences.devices:
+            device["use"] = True
+        # Set the Cycles engine device to GPU Compute if a compatible device
+        # was found, or to CPU only otherwise
+        bpy.context.scene.cycles.device = "GPU" if compute_type != "NONE" else "CPU"
+        # Let Cycles pick the tile size suited to the device
+        bpy.context.scene.cycles.use_auto_tile = True
+
+    # Check if get_mesh_args already prepared this mesh in this process
+    # (or a forked parent), so we can skip the duplicate import and
+    # preparation (the cache is keyed on the absolutized path, so relative
+    # and absolute spellings of the same mesh path both hit)
+    prepared = _PREPARED_CACHE.get(str(mesh_path.absolute()))
+    # If a prepared intermediate .blend exists for this mesh
+    if prepared is not None:
+        # Unpack the intermediate .blend file path and the object name
+        cache_blend_path, object_name = prepared
+        # Deselect everything first: unlike the mesh importers, wm.append
+        # does not clear the selection saved in the template scene, and the
+        # code below relies on the appended object being the only selection
+        bpy.ops.object.select_all(action="DESELECT")
+        # Append the already-prepared object from the intermediate file,
+        # avoiding the (Python-side) importer and the origin/transform redo
+        try:
+            import_result = bpy.ops.wm.append(
+                filepath=f"{cache_blend_path}/Object/{object_name}",
+                directory=f"{cache_blend_path}/Object",
+                filename=object_name,
+            )
+        except RuntimeError:
+            # bpy.ops surfaces operator errors (e.g. a missing file) as
+            # a RuntimeError rather than a result set
+            import_result = {"CANCELLED"}
+        # If the append did not complete (e.g. the intermediate file was
+        # cleaned away), fall back to the full import and preparation
+        if "FINISHED" not in import_result:
+            prepared = None
+            import_result = import_mesh(mesh_path)
+    else:
+        # Import the mesh to render and grab the result of the importing
+        import_result = import_mesh(mesh_path)
 
     # If the importing is complete
     if "FINISHED" in import_result:
@@ -189,40 +391,36 @@ def render_mesh(mesh_queue: MeshQueueItem) -> None:  # noqa: C901, PLR0912, PLR0
         # Set it as the active object in the view layer
         bpy.context.view_layer.objects.active = obj
 
-        # Set the origin of the object to the centre of volume of the object based
-        # on its bounding box
-        bpy.ops.object.origin_set(type="ORIGIN_CENTER_OF_VOLUME", center="BOUNDS")
-        # Then move the object's origin to the cartesian centre
-        obj.location = (0, 0, 0)
-        # Apply that location to the object
-        bpy.ops.object.transform_apply(location=True, scale=False, rotation=False)
-
-        # Set the scale of the object to the passed object_scale_factor arg
-        obj.scale[0:3] = (object_scale_factor, object_scale_factor, object_scale_factor)
-        # Apply that transformation to the object
-        bpy.ops.object.transform_apply(location=False, scale=True, rotation=False)
-
-        # Get the default scalebar tick size for this rescaled object as the largest
-        # object dimension and divide it by the 10 ticks in the scalebar
-        default_scalebar_tick_size = max([float(x) for x in obj.dimensions[0:3]]) / 10
-        # Calculate the rescale factor so that the object itself is by default actually
-        # only 10 units in size in its largest dimension (the matching of the dimensions
-        # and scalebar to the desired sizes will be done via mathematical trickery)
-        rescale_factor: float = 1 / max([float(x) for x in obj.dimensions[0:3]]) * 10
-        # Apply the rescale factor (the object is now 10 units in its largest dimension)
-        obj.scale[0:3] = (rescale_factor, rescale_factor, rescale_factor)
-        bpy.ops.object.transform_apply(location=False, scale=True, rotation=False)
+        # If the object was not appended from the prepared cache,
+        # set its origin and apply its location
+        # (appended objects were already prepared by get_mesh_args)
+        if prepared is None:
+            _prepare_object(obj)
+
+        # Read the unscaled object dimensions once (each access crosses the
+        # bpy C-boundary) and get the largest of them
+        longest_dimension = max(obj.dimensions)
+
+        # Get the default scalebar tick size for the object as rescaled by the
+        # passed object_scale_factor arg: the largest scaled dimension divided
+        # by the 10 ticks in the scalebar (pure arithmetic, no transform needed)
+        default_scalebar_tick_size = longest_dimension * object_scale_factor / 10
+
+        # Compose the scale factors in Python first so only a single
+        # transform_apply is needed (each apply triggers a full
+        # operator-context setup and dependency graph update in Blender):
+        # the object_scale_factor times the rescale factor that makes the
+        # object 10 units in its largest dimension (the matching of the
+        # dimensions and scalebar to the desired sizes will be done via
+        # mathematical trickery) simplifies to 10 / longest_dimension
+        total_scale_factor: float = 10 / longest_dimension
 
         # if the desired scalebar tick size is larger than the calculated default size
         if scalebar_tick_size > default_scalebar_tick_size:
-            # The rescale factor is now the default size divided by the desired size,
-            # meaning the object must be made smaller
-            # (since with larger tick size than default,
-            # it would be smaller than 10 scalebar ticks)
-            rescale_factor = default_scalebar_tick_size / scalebar_tick_size
-            # Apply this new rescale factor to the object
-            obj.scale[0:3] = (rescale_factor, rescale_factor, rescale_factor)
-            bpy.ops.object.transform_apply(location=False, scale=True, rotation=False)
+            # The object must additionally be made smaller by the ratio of the
+            # default size to the desired size (since with larger tick size
+            # than default, it would be smaller than 10 scalebar ticks)
+            total_scale_factor *= default_scalebar_tick_size / scalebar_tick_size
             scalebar_rescale_factor = 1.0
         # If the desired scalebar tick size is smaller than the calculated default size
         else:
@@ -237,8 +435,14 @@ def render_mesh(mesh_queue: MeshQueueItem) -> None:  # noqa: C901, PLR0912, PLR0
                 scalebar_rescale_factor,
                 scalebar_rescale_factor,
             )
-            # Apply the transformation
-            bpy.ops.object.transform_apply(location=False, scale=True, rotation=False)
+
+        # Set the composed scale on the object and apply it in one transform
+        obj.scale[0:3] = (
+            total_scale_factor,
+            total_scale_factor,
+            total_scale_factor,
+        )
+        bpy.ops.object.transform_apply(location=False, scale=True, rotation=False)
 
         # We set up the offset for the Array modifier that creates the scalebar at
         # the bottom of the image
@@ -254,37 +458,43 @@ def render_mesh(mesh_queue: MeshQueueItem) -> None:  # noqa: C901, PLR0912, PLR0
             else round(scalebar_tick_size, 4)
         )
 
-        # We store all the label and stroke objects of the scene into
-        # the labels variable
-        labels = [
+        # We store the label and stroke objects of the scene, split into the
+        # side and bottom scale ones so the loops below need no name checks
+        side_labels = [
             bpy.data.objects["Scale Label Left"],
-            bpy.data.objects["Scale Label Bottom"],
             bpy.data.objects["Scale Stroke Left"],
+        ]
+        bottom_labels = [
+            bpy.data.objects["Scale Label Bottom"],
             bpy.data.objects["Scale Stroke Bottom"],
         ]
-        # Then iterate through it
-        for x in labels:
-            # We make the label object text bodies be the same
-            x.data.body = f"{label_tick_size} cm"
-            # And if they are the labels from the bottom sscale
-            if " Bottom" in x.name:
-                # We position them correctly
-                x.location[0] = -5.15 / scalebar_rescale_factor - (
-                    0.4 / scalebar_rescale_factor - 0.4
-                )
-                x.location[1] = -5.58 / scalebar_rescale_factor
+        # Hoist the loop invariants: the label text body is identical for all
+        # labels, and the bottom label positions only depend on the scalebar
+        # rescale factor (the x position is the algebraic simplification of
+        # -5.15 / factor - (0.4 / factor - 0.4))
+        label_body = f"{label_tick_size} cm"
+        inverse_rescale = 1.0 / scalebar_rescale_factor
+        bottom_location_x = -5.15 * inverse_rescale - 0.4 * (inverse_rescale - 1.0)
+        bottom_location_y = -5.58 * inverse_rescale
+        # We make all the label object text bodies be the same
+        for x in side_labels + bottom_labels:
+            x.data.body = label_body
+        # And position the labels of the bottom scale correctly
+        for x in bottom_labels:
+            x.location[0] = bottom_location_x
+            x.location[1] = bottom_location_y
 
         # We set up the colour of the object based on the passed arg,
         # removing the initial # and appending to it 'ff' at the end,
         # since we need it as an RGBA hex
         object_colour = object_colour.lstrip("#") + "ff"
         # We also need to convert the hex to decimal values (0 to 1),
-        # so we iterate through the entire colour code (from pos 0 to 8, in steps of 2)
-        # convert the hex to a decimal number (int(object_colour[i:i+2], 16)),
-        # and divide by 255 to obtain the decimal RGBA
+        # so we parse the entire colour code in one bytes.fromhex call
+        # and scale each byte to the decimal RGBA range
+        # (multiplying by the precomputed 1/255 is cheaper than dividing)
         colour_tuple = cast(
             "tuple[float, float, float, float]",
-            tuple(int(object_colour[i : i + 2], 16) / 255 for i in range(0, 8, 2)),
+            tuple(x * _INV255 for x in bytes.fromhex(object_colour)),
         )
         # We have already prepared a material in the scene, so we simply
         # assign the colour tuple to the Principled BSDF diffuse colour value
@@ -296,20 +506,52 @@ def render_mesh(mesh_queue: MeshQueueItem) -> None:  # noqa: C901, PLR0912, PLR0
         mat = bpy.data.materials.get("ArtefactMaterial")
         obj.data.materials.append(mat)
 
-        # Loop through all six animation frames (i.e. all six orthogonal views:
-        # top, bottom, left, right, front, back)
-        for i in range(1, 7):
-            # Set the frame in the scene
-            bpy.context.scene.frame_set(frame=i)
-            # Set the render path of the png file for this frame
-            render_path = Path(
-                output_path
-                / f"{mesh_path.name.replace('.', '_')}_render_{i}_tick_length_"
-                f"{str(label_tick_size).replace('.', '-')}cm.png",
-            )
-            # Render the scene, and save to the stored path
-            bpy.ops.render.render()
-            bpy.data.images["Render Result"].save_render(filepath=str(render_path))
+        # Render all six animation frames (i.e. all six orthogonal views:
+        # top, bottom, left, right, front, back) in a single animation render,
+        # letting Blender reuse its render state across the frames and write
+        # the png files directly from the render pipeline
+        bpy.context.scene.frame_start = 1
+        bpy.context.scene.frame_end = 6
+        # Write the frames as png files
+        bpy.context.scene.render.image_settings.file_format = "PNG"
+        # Set the render path pattern for the frames (Blender replaces the
+        # '#' with the frame number and appends the file extension),
+        # formatted as a plain string without an intermediate Path allocation
+        tick_length_tag = str(label_tick_size).replace(".", "-")
+        bpy.context.scene.render.filepath = (
+            f"{os.fspath(output_path)}/{mesh_name}_render_#_tick_length_"
+            f"{tick_length_tag}cm"
+        )
+        # Render the scene frames, saving them to the set path pattern
+        # (the png encoding and file writes happen inside Blender's render
+        # pipeline as each frame finishes, so there is no Python-side save
+        # loop left that a writer thread could take off the critical path)
+        bpy.ops.render.render(animation=True)
 
-    # When we are done with rendering, quit this blender instance
-    bpy.ops.wm.quit_blender()
+
+def render_worker(mesh_queue: "Queue[MeshQueueItem | None]") -> None:
+    """Render mesh queue items from a multiprocessing queue until a sentinel.
+
+    Keeping the worker process resident amortizes Blender's startup cost
+    (Python init, bpy module init, GPU context creation) across all the
+    meshes the worker renders, instead of paying it once per mesh.
+    """
+    # Lazily import bpy on first use
+    bpy = _bpy()
+
+    # Keep consuming items from the queue
+    while True:
+        # Get the next mesh queue item
+        item = mesh_queue.get()
+        # A None item is the sentinel signalling there is no work left,
+        # so the worker can exit
+        if item is None:
+            break
+        # Free the orphaned data-blocks left over from the previous mesh,
+        # so memory does not accumulate across the meshes this worker renders
+        # (render_mesh itself replaces the scene by opening the template
+        # file, so no further reset is needed — in particular the
+        # preferences, including the Cycles device flags, are kept)
+        bpy.data.orphans_purge(do_recursive=True)
+        # Render the mesh
+        render_mesh(item)